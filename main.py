@@ -3,83 +3,327 @@
 Task Tracker CLI - A simple command-line task management tool
 """
 
-import argparse
-import json
+import functools
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Optional
+import time
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+
+_STATUS_TODO = sys.intern("todo")
+
+# Column headings and rule above the task listing
+_LIST_HEADER = (f"{'ID':<4} {'Status':<10} {'Description'}", "-" * 50)
+
+# Replayed task lists keyed by data file path, stamped with the file's
+# (mtime, size) and carrying the number of events in the log
+_TASKS_CACHE: Dict[str, Tuple[Tuple[int, int], List["Task"], int]] = {}
+
+
+@functools.cache
+def _json_codec() -> Tuple[Callable[[bytes], object], Callable[[object], bytes]]:
+    """Return (loads, dumps) for the fastest available JSON library, resolved once"""
+    try:
+        import orjson
+        return orjson.loads, orjson.dumps
+    except ImportError:
+        import json
+        return json.loads, lambda obj: json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _timestamp_ns(value: Union[int, str]) -> int:
+    """Return a timestamp as Unix epoch nanoseconds, converting legacy ISO-8601 strings"""
+    if not isinstance(value, str):
+        return value
+    if not value:
+        return 0
+    from datetime import datetime
+
+    try:
+        return round(datetime.fromisoformat(value).timestamp() * 1_000_000) * 1000
+    except ValueError:
+        # A bad timestamp shouldn't cost the task it belongs to
+        return 0
+
+
+class Task:
+    """A single task, stored with __slots__ rather than a per-task dict"""
+    
+    __slots__ = ('id', 'description', 'status', 'created_at', 'updated_at')
+    
+    def __init__(self, id: int, description: str = "", status: str = _STATUS_TODO,
+                 created_at: Union[int, str] = 0, updated_at: Union[int, str] = 0):
+        self.id = id
+        self.description = description
+        # Statuses repeat across every task, so share one string per value
+        self.status = sys.intern(status)
+        self.created_at = _timestamp_ns(created_at)
+        self.updated_at = _timestamp_ns(updated_at)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Task":
+        """Build a task from a stored record, ignoring fields Task doesn't know"""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+    
+    def to_dict(self) -> Dict:
+        """Return the task as a JSON-serialisable dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _tasks_from_records(records: Iterable) -> List[Task]:
+    """Build tasks from a legacy JSON array, skipping records that have no id"""
+    tasks = []
+    for record in records:
+        try:
+            tasks.append(Task.from_dict(record))
+        except (TypeError, AttributeError):
+            continue
+    return tasks
+
+
+def _replay_log(lines: Iterable[bytes], loads: Callable[[bytes], object]) -> Tuple[List[Task], int]:
+    """Replay add/delete events into a task list, returning it with the event count
+
+    If any line can't be replayed the count is sys.maxsize, so the next save
+    rewrites the log instead of appending after the damaged line.
+    """
+    by_id: Dict[int, Task] = {}
+    count = 0
+    damaged = False
+    for line in lines:
+        if not line.strip():
+            continue
+        count += 1
+        try:
+            event = loads(line)
+            op = event.pop('op')
+            if op == 'add':
+                task = Task.from_dict(event)
+                by_id[task.id] = task
+            elif op == 'delete':
+                by_id.pop(event['id'], None)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            # Torn write or unknown event; skip it rather than lose the log
+            damaged = True
+    return list(by_id.values()), sys.maxsize if damaged else count
 
 
 class TaskManager:
     """Manages tasks with basic CRUD operations"""
     
-    def __init__(self, data_file: str = "tasks.json"):
+    def __init__(self, data_file: str = "tasks.jsonl"):
         self.data_file = data_file
-        self.tasks = self._load_tasks()
+        self._log_lines = 0
+        self._index: Optional[Dict[int, Task]] = None
+        self._max_id = 0
+        self._pending: List[Dict] = []
+        self._batch_depth = 0
+        self._legacy_file: Optional[str] = None
     
-    def _load_tasks(self) -> List[Dict]:
-        """Load tasks from JSON file"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
+    def __enter__(self) -> "TaskManager":
+        """Defer saving until the outermost with block exits"""
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+    
+    def _ensure_loaded(self) -> Dict[int, Task]:
+        """Load the tasks on first use, so commands that never touch them skip the I/O"""
+        if self._index is None:
+            self._index = {task.id: task for task in self._load_tasks()}
+            self._max_id = max(self._index, default=0)
+        return self._index
+    
+    @property
+    def _by_id(self) -> Dict[int, Task]:
+        """Id -> task index, in insertion order"""
+        return self._ensure_loaded()
+    
+    @property
+    def tasks(self) -> List[Task]:
+        """All tasks, in insertion order"""
+        return list(self._by_id.values())
+    
+    def _load_tasks(self) -> List[Task]:
+        """Load tasks by replaying the JSON-lines event log"""
+        loads, _ = _json_codec()
+
+        try:
+            with open(self.data_file, 'rb') as f:
+                st = os.fstat(f.fileno())
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = _TASKS_CACHE.get(self.data_file)
+                if cached and cached[0] == stamp:
+                    self._log_lines = cached[2]
+                    return list(cached[1])
+                data = f.read()
+            if data[:1] == b'[':
+                # Legacy single JSON array; force a rewrite on next save
+                tasks = _tasks_from_records(loads(data))
+                lines = sys.maxsize
+            else:
+                tasks, lines = _replay_log(data.splitlines(), loads)
+            if not tasks and not data.strip():
+                # An empty log may just be a fresh checkout sitting beside old data
+                return self._load_legacy_tasks()
+        except FileNotFoundError:
+            return self._load_legacy_tasks()
+        except ValueError:
+            # Not valid JSON; overwrite it on the next save rather than append to it
+            self._log_lines = sys.maxsize
+            return []
+        except IOError:
+            return []
+        self._log_lines = lines
+        _TASKS_CACHE[self.data_file] = (stamp, tasks, lines)
+        return list(tasks)
+    
+    def _load_legacy_tasks(self) -> List[Task]:
+        """Load tasks from the pre-log tasks.json beside a missing or empty tasks.jsonl"""
+        root, ext = os.path.splitext(self.data_file)
+        if ext != '.jsonl':
+            return []
+        loads, _ = _json_codec()
+        try:
+            with open(root + '.json', 'rb') as f:
+                tasks = _tasks_from_records(loads(f.read()))
+        except (ValueError, IOError):
+            return []
+        # The log doesn't hold these yet; the next save writes it out in full
+        # and retires the old file
+        self._log_lines = sys.maxsize
+        self._legacy_file = root + '.json'
+        return tasks
+    
+    def _update_cache(self) -> None:
+        """Record the current tasks against the data file's new stamp"""
+        st = os.stat(self.data_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        _TASKS_CACHE[self.data_file] = (stamp, self.tasks, self._log_lines)
+    
+    def _append_events(self, events: List[Dict]) -> None:
+        """Append events to the log in a single write"""
+        _, dumps = _json_codec()
+        data = b''.join(dumps(event) + b'\n' for event in events)
+        try:
+            with open(self.data_file, 'ab') as f:
+                f.write(data)
+            self._log_lines += len(events)
+            self._update_cache()
+        except IOError as e:
+            print(f"Error saving tasks: {e}")
     
     def _save_tasks(self) -> None:
-        """Save tasks to JSON file"""
+        """Compact the log into one add event per task, atomically replacing it"""
+        _, dumps = _json_codec()
+        tasks = self.tasks
+        # A plain open() creates the temp file with the umask applied, like the data file
+        tmp_path = f"{self.data_file}.{os.getpid()}.tmp"
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.tasks, f, indent=2)
+            try:
+                mode: Optional[int] = os.stat(self.data_file).st_mode & 0o777
+            except FileNotFoundError:
+                mode = None
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(
+                    dumps({'op': 'add', **task.to_dict()}) + b'\n' for task in tasks
+                ))
+            if mode is not None:
+                # Keep the data file's own permissions across the replace
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self.data_file)
+            self._log_lines = len(tasks)
+            self._update_cache()
+            if self._legacy_file:
+                # Migrated; move the old file aside so an emptied log can't revive it
+                try:
+                    os.replace(self._legacy_file, self._legacy_file + '.bak')
+                except OSError:
+                    pass
+                self._legacy_file = None
         except IOError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             print(f"Error saving tasks: {e}")
     
+    def _record(self, event: Dict) -> None:
+        """Queue an event and write it out unless inside a with block"""
+        self._pending.append(event)
+        if not self._batch_depth:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write pending events to disk, compacting once the log is mostly churn"""
+        if not self._pending:
+            return
+        if self._log_lines + len(self._pending) > 2 * len(self._by_id):
+            self._save_tasks()
+        else:
+            self._append_events(self._pending)
+        self._pending = []
+    
     def add_task(self, description: str) -> None:
         """Add a new task"""
-        task = {
-            "id": self._get_next_id(),
-            "description": description,
-            "status": "todo",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
-        self.tasks.append(task)
-        self._save_tasks()
-        print(f"Task added successfully (ID: {task['id']})")
+        now = time.time_ns()
+        task = Task(self._get_next_id(), description, created_at=now, updated_at=now)
+        self._by_id[task.id] = task
+        self._record({'op': 'add', **task.to_dict()})
+        print(f"Task added successfully (ID: {task.id})")
     
-    def list_tasks(self) -> None:
-        """List all tasks"""
-        if not self.tasks:
-            print("No tasks found.")
+    def iter_tasks(self) -> Iterator[str]:
+        """Yield the task listing one formatted line at a time"""
+        if not self._by_id:
+            yield "No tasks found."
             return
         
-        print(f"{'ID':<4} {'Status':<10} {'Description'}")
-        print("-" * 50)
-        for task in self.tasks:
-            print(f"{task['id']:<4} {task['status']:<10} {task['description']}")
+        yield from _LIST_HEADER
+        for task in self._by_id.values():
+            yield f"{task.id:<4} {task.status:<10} {task.description}"
+    
+    def list_tasks(self) -> None:
+        """List all tasks"""
+        sys.stdout.write('\n'.join(self.iter_tasks()) + '\n')
     
     def delete_task(self, task_id: int) -> None:
         """Delete a task by ID"""
-        original_count = len(self.tasks)
-        self.tasks = [task for task in self.tasks if task['id'] != task_id]
-        
-        if len(self.tasks) < original_count:
-            self._save_tasks()
+        if self._by_id.pop(task_id, None) is not None:
+            self._record({'op': 'delete', 'id': task_id})
             print(f"Task {task_id} deleted successfully.")
         else:
             print(f"Task with ID {task_id} not found.")
     
     def _get_next_id(self) -> int:
         """Get the next available ID"""
-        if not self.tasks:
-            return 1
-        return max(task['id'] for task in self.tasks) + 1
+        self._ensure_loaded()
+        self._max_id += 1
+        return self._max_id
 
 
-def main():
-    """Main CLI entry point"""
+# Subcommand -> (unbound TaskManager method, parsed arguments -> method arguments)
+_DISPATCH = {
+    'add': (TaskManager.add_task, lambda args: (args.description,)),
+    'list': (TaskManager.list_tasks, lambda args: ()),
+    'delete': (TaskManager.delete_task, lambda args: (args.id,)),
+}
+
+_COMMANDS = tuple(_DISPATCH)
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if there isn't a known one"""
+    if len(argv) > 1 and argv[1] in _COMMANDS:
+        return argv[1]
+    return None
+
+
+@functools.cache
+def _build_parser(command: Optional[str]):
+    """Build the argument parser, with only `command`'s subparser if one is given"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Task Tracker CLI - Manage your tasks from the command line",
         prog="task-tracker"
@@ -88,16 +332,26 @@ def main():
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Add command
-    add_parser = subparsers.add_parser('add', help='Add a new task')
-    add_parser.add_argument('description', help='Task description')
+    if command in (None, 'add'):
+        add_parser = subparsers.add_parser('add', help='Add a new task')
+        add_parser.add_argument('description', help='Task description')
     
     # List command
-    list_parser = subparsers.add_parser('list', help='List all tasks')
+    if command in (None, 'list'):
+        subparsers.add_parser('list', help='List all tasks')
     
     # Delete command
-    delete_parser = subparsers.add_parser('delete', help='Delete a task')
-    delete_parser.add_argument('id', type=int, help='Task ID to delete')
+    if command in (None, 'delete'):
+        delete_parser = subparsers.add_parser('delete', help='Delete a task')
+        delete_parser.add_argument('id', type=int, help='Task ID to delete')
     
+    return parser
+
+
+def main():
+    """Main CLI entry point"""
+    # Only register the subcommand being invoked; help and errors need them all
+    parser = _build_parser(_sniff_subcommand(sys.argv))
     args = parser.parse_args()
     
     # Show help if no command provided
@@ -105,16 +359,12 @@ def main():
         parser.print_help()
         return
     
-    # Initialize task manager
+    # Initialize task manager; tasks are only read once a handler needs them
     task_manager = TaskManager()
     
-    # Execute commands
-    if args.command == 'add':
-        task_manager.add_task(args.description)
-    elif args.command == 'list':
-        task_manager.list_tasks()
-    elif args.command == 'delete':
-        task_manager.delete_task(args.id)
+    # Execute command
+    method, get_args = _DISPATCH[args.command]
+    method(task_manager, *get_args(args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+"""Tests for the TaskManager event-log storage"""
+
+import os
+import sys
+
+import pytest
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    main._TASKS_CACHE.clear()
+    yield
+    main._TASKS_CACHE.clear()
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    return str(tmp_path / "tasks.jsonl")
+
+
+def reload(data_file):
+    main._TASKS_CACHE.clear()
+    return main.TaskManager(data_file)
+
+
+def log_lines(data_file):
+    with open(data_file, 'rb') as f:
+        return f.read().splitlines()
+
+
+def test_append_then_replay(data_file):
+    tm = main.TaskManager(data_file)
+    tm.add_task("one")
+    tm.add_task("two")
+    tm.add_task("three")
+    tm.delete_task(2)
+
+    assert len(log_lines(data_file)) == 4
+    tasks = reload(data_file).tasks
+    assert [(t.id, t.description) for t in tasks] == [(1, "one"), (3, "three")]
+
+
+def test_compacts_once_log_is_mostly_churn(data_file):
+    tm = main.TaskManager(data_file)
+    tm.add_task("one")
+    tm.add_task("two")
+    # Three events for one live task crosses the 2x threshold
+    tm.delete_task(1)
+
+    assert len(log_lines(data_file)) == 1
+    assert [t.id for t in reload(data_file).tasks] == [2]
+
+
+def test_appends_below_compaction_threshold(data_file):
+    tm = main.TaskManager(data_file)
+    for description in ("one", "two", "three"):
+        tm.add_task(description)
+    tm.delete_task(1)
+
+    assert len(log_lines(data_file)) == 4
+
+
+def test_torn_last_line_does_not_swallow_next_event(data_file):
+    main.TaskManager(data_file).add_task("one")
+    with open(data_file, 'ab') as f:
+        f.write(b'{"op":"add","id":99')
+
+    reload(data_file).add_task("two")
+
+    tasks = reload(data_file).tasks
+    assert [(t.id, t.description) for t in tasks] == [(1, "one"), (2, "two")]
+
+
+@pytest.mark.parametrize("existing_log", [False, True])
+def test_migrates_legacy_tasks_json(tmp_path, data_file, existing_log):
+    legacy = tmp_path / "tasks.json"
+    legacy.write_text(
+        '[{"id": 1, "description": "old", "status": "todo",'
+        ' "created_at": "2024-01-01T00:00:00", "updated_at": "2024-01-01T00:00:00"},'
+        ' {"id": 2, "description": "older", "status": "todo", "done": false}]'
+    )
+    if existing_log:
+        open(data_file, 'w').close()
+
+    main.TaskManager(data_file).add_task("new")
+
+    tasks = reload(data_file).tasks
+    assert [(t.id, t.description) for t in tasks] == [(1, "old"), (2, "older"), (3, "new")]
+    assert not legacy.exists()
+    assert (tmp_path / "tasks.json.bak").exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_compaction_keeps_file_permissions(data_file):
+    tm = main.TaskManager(data_file)
+    tm.add_task("one")
+    os.chmod(data_file, 0o640)
+
+    tm.delete_task(1)
+
+    assert os.stat(data_file).st_mode & 0o777 == 0o640